@@ -5,34 +5,123 @@ This script checks and updates GlobalProtect agent software on Palo Alto firewal
 using API keys retrieved from 1Password.
 """
 
+import asyncio
+import atexit
+import ipaddress
 import json
-import requests
+import queue
+import re
 import subprocess
 import sys
+import threading
 import time
 import logging
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
-import xml.etree.ElementTree as ET
+from logging.handlers import QueueHandler, QueueListener
+from io import BytesIO
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'globalprotect_update_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler()
-    ]
-)
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# Configure logging. Records are queued and written to the file and console
+# by a background listener, so concurrent firewall tasks never block on I/O.
+_log_handlers = [
+    logging.FileHandler(f'globalprotect_update_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue side only merges arguments into the message; the listener's
+# handlers apply the real format
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# httpx logs every request URL at INFO; keep its chatter out of the audit log
+for _noisy_logger in ('httpx', 'httpcore'):
+    logging.getLogger(_noisy_logger).setLevel(logging.WARNING)
+
+# Polling schedule for software check results: start dense, double the
+# delay while nothing is available, and give up after the deadline
+SOFTWARE_CHECK_INITIAL_DELAY = 0.5
+SOFTWARE_CHECK_MAX_DELAY = 8.0
+SOFTWARE_CHECK_TIMEOUT = 60
+
+# Upper bound on simultaneous firewall connections from the shared client,
+# and on firewalls processed at once
+MAX_CONNECTIONS = 50
+
+
+def _compile_path(path: str):
+    """Compile an element path once (lxml), or defer to findall (stdlib)"""
+    if HAS_LXML:
+        return ET.XPath(path)
+    return lambda element: element.findall(path)
+
+
+_XP_SYSTEM = _compile_path('.//result/system')
+_XP_MSG = _compile_path('.//msg')
+
+
+def _iter_entries(xml_bytes: bytes) -> Iterator['ET.Element']:
+    """
+    Stream <entry> elements from an API response without building the full tree
+
+    Each entry is cleared once the caller moves on to the next one, so values
+    must be read from it before advancing the iterator.
+    """
+    if HAS_LXML:
+        events = ET.iterparse(BytesIO(xml_bytes), events=('end',), tag='entry')
+    else:
+        events = (
+            (event, elem) for event, elem in ET.iterparse(BytesIO(xml_bytes), events=('end',))
+            if elem.tag == 'entry'
+        )
+    
+    for _, elem in events:
+        yield elem
+        elem.clear()
+        if HAS_LXML:
+            # Drop already-processed siblings so the partial tree stays small
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def _entry_fields(entry: 'ET.Element') -> Dict[str, str]:
+    """Collect an entry's child element texts in a single pass over its children"""
+    return {child.tag: child.text or '' for child in entry}
+
 
 class OnePasswordClient:
     """Handle 1Password CLI operations"""
     
     def __init__(self):
         self.check_op_cli()
+        # API keys already retrieved this run, keyed by (item_name, vault).
+        # Lookups run in worker threads, so access goes through the lock.
+        self._cache: Dict[Tuple[str, str], str] = {}
+        self._cache_lock = threading.Lock()
     
     def check_op_cli(self):
         """Verify 1Password CLI is installed and configured"""
@@ -43,12 +132,12 @@ class OnePasswordClient:
                 text=True,
                 check=True
             )
-            logger.info(f"1Password CLI version: {result.stdout.strip()}")
+            logger.info("1Password CLI version: %s", result.stdout.strip())
         except FileNotFoundError:
             logger.error("1Password CLI (op) not found. Please install it from https://1password.com/downloads/command-line/")
             sys.exit(1)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Error checking 1Password CLI: {e}")
+            logger.error("Error checking 1Password CLI: %s", e)
             sys.exit(1)
     
     def get_api_key(self, item_name: str, vault: str) -> Optional[str]:
@@ -62,8 +151,13 @@ class OnePasswordClient:
         Returns:
             API key string or None if retrieval fails
         """
+        cache_key = (item_name, vault)
+        with self._cache_lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+        
         try:
-            logger.info(f"Retrieving API key for '{item_name}' from vault '{vault}'")
+            logger.info("Retrieving API key for '%s' from vault '%s'", item_name, vault)
             
             # Use 'op item get' to retrieve the password field
             result = subprocess.run(
@@ -75,73 +169,197 @@ class OnePasswordClient:
             
             api_key = result.stdout.strip()
             if api_key:
-                logger.info(f"Successfully retrieved API key for '{item_name}'")
+                logger.info("Successfully retrieved API key for '%s'", item_name)
+                with self._cache_lock:
+                    self._cache[cache_key] = api_key
                 return api_key
             else:
-                logger.error(f"Empty API key returned for '{item_name}'")
+                logger.error("Empty API key returned for '%s'", item_name)
                 return None
                 
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to retrieve API key for '{item_name}': {e.stderr}")
+            logger.error("Failed to retrieve API key for '%s': %s", item_name, e.stderr)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error retrieving API key: {e}")
+            logger.error("Unexpected error retrieving API key: %s", e)
             return None
+    
+    def prefetch(self, pairs: List[Tuple[str, str]]):
+        """
+        Retrieve API keys for many items up front with two op calls per vault
+        
+        Items that cannot be prefetched are left uncached, so get_api_key
+        falls back to retrieving them individually.
+        
+        Args:
+            pairs: (item_name, vault) tuples, as used by get_api_key
+        """
+        by_vault: Dict[str, set] = {}
+        for item_name, vault in pairs:
+            with self._cache_lock:
+                cached = (item_name, vault) in self._cache
+            if not cached:
+                by_vault.setdefault(vault, set()).add(item_name)
+        
+        for vault, item_names in by_vault.items():
+            logger.info("Prefetching %s API keys from vault '%s'", len(item_names), vault)
+            
+            try:
+                listing = subprocess.run(
+                    ['op', 'item', 'list', '--vault', vault, '--format=json'],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                listed = json.loads(listing.stdout)
+                
+                # A title shared by several items cannot be resolved safely;
+                # leave it to get_api_key, where op reports the ambiguity
+                title_counts = Counter(item.get('title') for item in listed)
+                ambiguous = {name for name in item_names if title_counts[name] > 1}
+                for name in sorted(ambiguous):
+                    logger.warning("Multiple items titled '%s' in vault '%s', not prefetching it",
+                                   name, vault)
+                resolvable = item_names - ambiguous
+                
+                wanted = [
+                    item for item in listed
+                    if item.get('title') in resolvable or item.get('id') in resolvable
+                ]
+                if not wanted:
+                    continue
+                
+                # 'op item get -' reads the item list from stdin and returns
+                # every item in a single invocation
+                result = subprocess.run(
+                    ['op', 'item', 'get', '-', '--format=json'],
+                    input=json.dumps(wanted),
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                items = list(self._iter_json_documents(result.stdout))
+            except subprocess.CalledProcessError as e:
+                logger.warning("Failed to prefetch API keys from vault '%s': %s", vault, e.stderr)
+                continue
+            except json.JSONDecodeError as e:
+                logger.warning("Invalid JSON from 1Password CLI for vault '%s': %s", vault, e)
+                continue
+            
+            fetched = 0
+            for item in items:
+                api_key = next(
+                    (field.get('value') for field in item.get('fields', [])
+                     if field.get('id') == 'password' or field.get('label') == 'password'),
+                    None
+                )
+                if not api_key:
+                    continue
+                for name in (item.get('title'), item.get('id')):
+                    if name in resolvable:
+                        with self._cache_lock:
+                            self._cache[(name, vault)] = api_key
+                        fetched += 1
+            
+            logger.info("Prefetched %s of %s API keys from vault '%s'", fetched, len(item_names), vault)
+    
+    @staticmethod
+    def _iter_json_documents(text: str) -> Iterator:
+        """Yield items from op output, which may be an array or concatenated objects"""
+        decoder = json.JSONDecoder()
+        whitespace = re.compile(r'\s*')
+        idx = whitespace.match(text).end()
+        
+        while idx < len(text):
+            document, idx = decoder.raw_decode(text, idx)
+            if isinstance(document, list):
+                yield from document
+            else:
+                yield document
+            idx = whitespace.match(text, idx).end()
 
 
 class PaloAltoFirewall:
     """Handle Palo Alto Firewall API operations"""
     
-    def __init__(self, hostname: str, api_key: str, name: str):
+    def __init__(self, hostname: str, api_key: str, name: str, client: httpx.AsyncClient):
         self.hostname = hostname
         self.api_key = api_key
         self.name = name
-        self.base_url = f"https://{hostname}/api"
-        self.session = requests.Session()
-        self.session.verify = False  # Consider using proper SSL verification in production
+        self.base_url = f"https://{self._url_host(hostname)}/api"
+        self.client = client
         
-    def _make_request(self, params: Dict) -> Optional[ET.Element]:
-        """Make API request to firewall"""
-        params['key'] = self.api_key
+    @staticmethod
+    def _url_host(hostname: str) -> str:
+        """Bracket IPv6 literals so they are valid in a URL"""
+        try:
+            if ipaddress.ip_address(hostname).version == 6:
+                return f"[{hostname}]"
+        except ValueError:
+            pass
+        return hostname
+    
+    async def _make_request(self, params: Dict, raw: bool = False) -> Optional[Union['ET.Element', bytes]]:
+        """
+        Make API request to firewall
+        
+        Args:
+            params: Query parameters for the API call
+            raw: Return the undecoded response body instead of a parsed tree,
+                for large responses that are streamed with _iter_entries
+                
+        Returns:
+            Parsed root element (or raw bytes), or None if the request fails
+        """
+        # Send the key as a header so it never appears in request URLs
+        headers = {'X-PAN-KEY': self.api_key}
         
         try:
-            response = self.session.get(self.base_url, params=params, timeout=30)
+            response = await self.client.get(self.base_url, params=params, headers=headers)
             response.raise_for_status()
             
+            # Only the root tag is needed to confirm success; failures are
+            # small and fall through to the full parse for the error message
+            if raw:
+                _, response_root = next(ET.iterparse(BytesIO(response.content), events=('start',)))
+                if response_root.get('status') == 'success':
+                    return response.content
+            
             root = ET.fromstring(response.content)
             status = root.get('status')
             
             if status != 'success':
-                error_msg = root.find('.//msg')
-                error_text = error_msg.text if error_msg is not None else 'Unknown error'
-                logger.error(f"API request failed for {self.name}: {error_text}")
+                error_msgs = _XP_MSG(root)
+                error_text = error_msgs[0].text if error_msgs else 'Unknown error'
+                logger.error("API request failed for %s: %s", self.name, error_text)
                 return None
                 
             return root
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {self.name}: {e}")
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            logger.error("Request failed for %s: %s", self.name, e)
             return None
         except ET.ParseError as e:
-            logger.error(f"Failed to parse XML response for {self.name}: {e}")
+            logger.error("Failed to parse XML response for %s: %s", self.name, e)
             return None
     
-    def get_system_info(self) -> Optional[Dict]:
+    async def get_system_info(self) -> Optional[Dict]:
         """Get system information"""
-        logger.info(f"Getting system info for {self.name}")
+        logger.info("Getting system info for %s", self.name)
         
         params = {
             'type': 'op',
             'cmd': '<show><system><info></info></system></show>'
         }
         
-        root = self._make_request(params)
+        root = await self._make_request(params)
         if root is None:
             return None
         
-        result = root.find('.//result/system')
-        if result is None:
+        systems = _XP_SYSTEM(root)
+        if not systems:
             return None
+        result = systems[0]
         
         info = {
             'hostname': result.findtext('hostname', 'Unknown'),
@@ -152,112 +370,142 @@ class PaloAltoFirewall:
         
         return info
     
-    def get_globalprotect_versions(self) -> Optional[Dict]:
+    async def get_globalprotect_versions(self) -> Optional[Dict]:
         """Get available GlobalProtect client versions"""
-        logger.info(f"Getting GlobalProtect versions for {self.name}")
+        logger.info("Getting GlobalProtect versions for %s", self.name)
         
         params = {
             'type': 'op',
             'cmd': '<request><global-protect-gateway><client-upgrade><list></list></client-upgrade></global-protect-gateway></request>'
         }
         
-        root = self._make_request(params)
-        if root is None:
+        content = await self._make_request(params, raw=True)
+        if content is None:
             return None
         
         versions = {}
-        entries = root.findall('.//entry')
         
-        for entry in entries:
-            version = entry.findtext('version', 'Unknown')
-            os_type = entry.findtext('os', 'Unknown')
-            filename = entry.findtext('filename', 'Unknown')
-            
-            if os_type not in versions:
-                versions[os_type] = []
-            
-            versions[os_type].append({
-                'version': version,
-                'filename': filename
-            })
+        try:
+            for fields in map(_entry_fields, _iter_entries(content)):
+                versions.setdefault(fields.get('os', 'Unknown'), []).append({
+                    'version': fields.get('version', 'Unknown'),
+                    'filename': fields.get('filename', 'Unknown')
+                })
+        except ET.ParseError as e:
+            logger.error("Failed to parse XML response for %s: %s", self.name, e)
+            return None
         
         return versions
     
-    def check_software_updates(self) -> Optional[Dict]:
+    async def check_software_updates(self) -> Optional[Dict]:
         """Check for available software updates"""
-        logger.info(f"Checking for software updates on {self.name}")
+        logger.info("Checking for software updates on %s", self.name)
         
         params = {
             'type': 'op',
             'cmd': '<request><system><software><check></check></software></system></request>'
         }
         
-        root = self._make_request(params)
-        if root is None:
+        content = await self._make_request(params, raw=True)
+        if content is None:
             return None
         
-        # Wait for check to complete and get results
-        time.sleep(5)
+        # The check response normally carries the refreshed version list
+        # itself, in which case no info request is needed
+        updates = self._parse_software_info(content)
+        if updates is None:
+            return None
+        if self._has_versions(updates):
+            return updates
         
         params = {
             'type': 'op',
             'cmd': '<request><system><software><info></info></software></system></request>'
         }
         
-        root = self._make_request(params)
-        if root is None:
-            return None
-        
-        updates = []
-        entries = root.findall('.//entry')
+        # Otherwise poll info until the check has populated the version list,
+        # backing off exponentially so fast firewalls return quickly and slow
+        # ones are not hammered. The check itself is not re-issued.
+        delay = SOFTWARE_CHECK_INITIAL_DELAY
+        deadline = time.monotonic() + SOFTWARE_CHECK_TIMEOUT
         
-        for entry in entries:
-            version = entry.findtext('version', 'Unknown')
-            downloaded = entry.findtext('downloaded', 'no')
-            current = entry.findtext('current', 'no')
+        while True:
+            content = await self._make_request(params, raw=True)
+            if content is None:
+                return None
+            
+            updates = self._parse_software_info(content)
+            if updates is None:
+                return None
+            
+            if self._has_versions(updates):
+                return updates
             
-            updates.append({
-                'version': version,
-                'downloaded': downloaded == 'yes',
-                'current': current == 'yes'
-            })
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("Software check on %s did not complete within %ss, using last results",
+                               self.name, SOFTWARE_CHECK_TIMEOUT)
+                return updates
+            
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, SOFTWARE_CHECK_MAX_DELAY)
+    
+    @staticmethod
+    def _has_versions(updates: List[Dict]) -> bool:
+        """Whether a software check has populated the version list"""
+        return any(update['version'] != 'Unknown' for update in updates)
+    
+    def _parse_software_info(self, content: bytes) -> Optional[List[Dict]]:
+        """Parse a software check/info response into a list of versions"""
+        try:
+            updates = [
+                {
+                    'version': fields.get('version', 'Unknown'),
+                    'downloaded': fields.get('downloaded') == 'yes',
+                    'current': fields.get('current') == 'yes'
+                }
+                for fields in map(_entry_fields, _iter_entries(content))
+            ]
+        except ET.ParseError as e:
+            logger.error("Failed to parse XML response for %s: %s", self.name, e)
+            return None
         
         return updates
     
-    def download_software(self, version: str) -> bool:
+    async def download_software(self, version: str) -> bool:
         """Download software version"""
-        logger.info(f"Downloading software version {version} on {self.name}")
+        logger.info("Downloading software version %s on %s", version, self.name)
         
         params = {
             'type': 'op',
             'cmd': f'<request><system><software><download><version>{version}</version></download></software></system></request>'
         }
         
-        root = self._make_request(params)
+        root = await self._make_request(params)
         return root is not None
     
-    def install_software(self, version: str) -> bool:
+    async def install_software(self, version: str) -> bool:
         """Install software version"""
-        logger.info(f"Installing software version {version} on {self.name}")
+        logger.info("Installing software version %s on %s", version, self.name)
         
         params = {
             'type': 'op',
             'cmd': f'<request><system><software><install><version>{version}</version></install></software></system></request>'
         }
         
-        root = self._make_request(params)
+        root = await self._make_request(params)
         return root is not None
     
-    def commit_config(self) -> bool:
+    async def commit_config(self) -> bool:
         """Commit configuration changes"""
-        logger.info(f"Committing configuration on {self.name}")
+        logger.info("Committing configuration on %s", self.name)
         
         params = {
             'type': 'commit',
             'cmd': '<commit></commit>'
         }
         
-        root = self._make_request(params)
+        root = await self._make_request(params)
         return root is not None
 
 
@@ -269,84 +517,110 @@ class GlobalProtectUpdateManager:
         self.inventory = self.load_inventory()
         self.op_client = OnePasswordClient()
         self.results = []
+        # Shared by every result and the report name so a run sorts as a unit
+        self.run_ts = datetime.now()
+        self._run_ts_iso = self.run_ts.isoformat()
+        # Shared by all firewalls so the connection pool, TLS settings and
+        # connection limits apply across the whole run. Idle connections are
+        # kept longer than the longest poll delay so a firewall's requests
+        # reuse one TLS session.
+        # Consider using proper SSL verification in production.
+        self.client = httpx.AsyncClient(
+            verify=False,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+                keepalive_expiry=SOFTWARE_CHECK_MAX_DELAY * 4
+            )
+        )
     
     def load_inventory(self) -> Dict:
         """Load firewall inventory from JSON file"""
         try:
-            with open(self.inventory_file, 'r') as f:
-                inventory = json.load(f)
-            logger.info(f"Loaded inventory with {len(inventory['firewalls'])} firewalls")
+            data = Path(self.inventory_file).read_bytes()
+            inventory = orjson.loads(data) if orjson else json.loads(data)
+            logger.info("Loaded inventory with %s firewalls", len(inventory['firewalls']))
             return inventory
         except FileNotFoundError:
-            logger.error(f"Inventory file not found: {self.inventory_file}")
+            logger.error("Inventory file not found: %s", self.inventory_file)
             sys.exit(1)
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in inventory file: {e}")
+            logger.error("Invalid JSON in inventory file: %s", e)
             sys.exit(1)
     
-    def process_firewall(self, firewall_config: Dict) -> Dict:
-        """Process a single firewall"""
-        result = {
+    def _new_result(self, firewall_config: Dict) -> Dict:
+        """Create the (initially failed) result record for a firewall"""
+        return {
             'name': firewall_config['name'],
             'hostname': firewall_config['hostname'],
             'success': False,
             'message': '',
             'system_info': None,
             'available_updates': None,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._run_ts_iso
         }
+    
+    async def process_firewall(self, firewall_config: Dict) -> Dict:
+        """Process a single firewall"""
+        result = self._new_result(firewall_config)
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing firewall: {firewall_config['name']}")
-        logger.info(f"{'='*60}")
+        # Firewalls run concurrently, so every line below names its firewall
+        # rather than relying on a banner for grouping
+        name = firewall_config['name']
+        logger.info("Processing firewall: %s", name)
         
-        # Retrieve API key from 1Password
-        api_key = self.op_client.get_api_key(
+        # Retrieve API key from 1Password. The op CLI call blocks, so it runs
+        # in a worker thread to keep other firewalls' requests moving.
+        api_key = await asyncio.to_thread(
+            self.op_client.get_api_key,
             firewall_config['onepassword_item'],
             firewall_config['onepassword_vault']
         )
         
         if not api_key:
             result['message'] = 'Failed to retrieve API key from 1Password'
-            logger.error(result['message'])
+            logger.error("%s: %s", name, result['message'])
             return result
         
         # Connect to firewall
         fw = PaloAltoFirewall(
             firewall_config['hostname'],
             api_key,
-            firewall_config['name']
+            name,
+            client=self.client
         )
         
         # Get system info
-        system_info = fw.get_system_info()
+        system_info = await fw.get_system_info()
         if system_info:
             result['system_info'] = system_info
-            logger.info(f"Current SW version: {system_info['sw_version']}")
-            logger.info(f"Model: {system_info['model']}")
+            logger.info("%s: Current SW version: %s", name, system_info['sw_version'])
+            logger.info("%s: Model: %s", name, system_info['model'])
         else:
             result['message'] = 'Failed to get system information'
             return result
         
         # Check for updates
-        updates = fw.check_software_updates()
+        updates = await fw.check_software_updates()
         if updates:
             result['available_updates'] = updates
-            logger.info(f"Available updates: {len(updates)}")
+            logger.info("%s: Available updates: %s", name, len(updates))
             
             for update in updates:
-                logger.info(f"  - Version {update['version']}: "
-                          f"Downloaded={update['downloaded']}, Current={update['current']}")
+                logger.info("%s:   - Version %s: Downloaded=%s, Current=%s",
+                            name, update['version'], update['downloaded'], update['current'])
         else:
             result['message'] = 'Failed to check for updates'
             return result
         
         # Get GlobalProtect client versions
-        gp_versions = fw.get_globalprotect_versions()
+        gp_versions = await fw.get_globalprotect_versions()
         if gp_versions:
-            logger.info("GlobalProtect client versions available:")
+            logger.info("%s: GlobalProtect client versions available:", name)
             for os_type, versions in gp_versions.items():
-                logger.info(f"  {os_type}: {len(versions)} versions")
+                logger.info("%s:   %s: %s versions", name, os_type, len(versions))
         
         result['success'] = True
         result['message'] = 'Successfully checked firewall'
@@ -356,21 +630,48 @@ class GlobalProtectUpdateManager:
     def run(self):
         """Run the update check/process for all firewalls"""
         logger.info("Starting GlobalProtect update automation")
-        logger.info(f"Processing {len(self.inventory['firewalls'])} firewalls")
-        
-        # Disable SSL warnings (consider proper SSL verification in production)
-        requests.packages.urllib3.disable_warnings()
+        logger.info("Processing %s firewalls", len(self.inventory['firewalls']))
         
+        enabled = []
         for fw_config in self.inventory['firewalls']:
             if not fw_config.get('enabled', True):
-                logger.info(f"Skipping disabled firewall: {fw_config['name']}")
+                logger.info("Skipping disabled firewall: %s", fw_config['name'])
                 continue
-            
-            result = self.process_firewall(fw_config)
-            self.results.append(result)
+            enabled.append(fw_config)
+        
+        self.op_client.prefetch([
+            (fw_config['onepassword_item'], fw_config['onepassword_vault'])
+            for fw_config in enabled
+        ])
+        
+        self.results = asyncio.run(self.process_firewalls(enabled))
         
         self.generate_report()
     
+    async def process_firewalls(self, firewall_configs: List[Dict]) -> List[Dict]:
+        """Process firewalls concurrently, returning results in inventory order"""
+        # Keep no more firewalls in flight than the client has connections, so
+        # queued firewalls wait here instead of hitting the pool timeout
+        slots = asyncio.Semaphore(MAX_CONNECTIONS)
+        
+        async def process_with_slot(fw_config: Dict) -> Dict:
+            # An unexpected error fails only this firewall, not the whole run
+            async with slots:
+                try:
+                    return await self.process_firewall(fw_config)
+                except Exception as e:
+                    logger.exception("%s: Unexpected error while processing firewall", fw_config['name'])
+                    result = self._new_result(fw_config)
+                    result['message'] = f'Unexpected error: {e}'
+                    return result
+        
+        async with self.client:
+            results = await asyncio.gather(
+                *(process_with_slot(fw_config) for fw_config in firewall_configs)
+            )
+        
+        return list(results)
+    
     def generate_report(self):
         """Generate summary report"""
         logger.info("\n" + "="*60)
@@ -380,16 +681,21 @@ class GlobalProtectUpdateManager:
         successful = sum(1 for r in self.results if r['success'])
         failed = len(self.results) - successful
         
-        logger.info(f"Total firewalls processed: {len(self.results)}")
-        logger.info(f"Successful: {successful}")
-        logger.info(f"Failed: {failed}")
+        logger.info("Total firewalls processed: %s", len(self.results))
+        logger.info("Successful: %s", successful)
+        logger.info("Failed: %s", failed)
         
         # Save detailed report
-        report_file = f'update_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(report_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        report_file = f'update_report_{self.run_ts.strftime("%Y%m%d_%H%M%S")}.json'
+        # Without orjson, write compact JSON rather than pretty-printing in Python
+        if orjson:
+            report = orjson.dumps(self.results, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            report = json.dumps(self.results, separators=(',', ':'), default=str).encode()
+        with open(report_file, 'wb') as f:
+            f.write(report)
         
-        logger.info(f"\nDetailed report saved to: {report_file}")
+        logger.info("\nDetailed report saved to: %s", report_file)
 
 
 def main():
@@ -1,20 +1,84 @@
 #!/usr/bin/env python3
 """
 Helper script to manage firewall inventory
+
+Run without arguments for the interactive menu, or with a subcommand
+(list, add, bulk-add, rm, enable, disable, settings) for scripted edits.
+Each subcommand loads the inventory once and saves it at most once.
 """
 
+import argparse
+import csv
 import json
 import sys
-from typing import Dict, List
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 INVENTORY_FILE = 'firewall_inventory.json'
 
+LIST_ROW_FORMAT = "{name:<20} {hostname:<30} {enabled:<10} {location:<20}"
+
+# Columns bulk-add maps onto Firewall fields; any others go into Firewall.extra
+CSV_COLUMNS = ('name', 'hostname', 'onepassword_item', 'onepassword_vault', 'ip', 'location', 'model')
+
+
+@dataclass(slots=True, kw_only=True)
+class Firewall:
+    """
+    A firewall entry from the inventory file
+    
+    Required fields are only enforced by create_firewall; entries read from
+    an incomplete file keep None for missing values so they can still be
+    listed, fixed or removed.
+    """
+    name: Optional[str]
+    hostname: Optional[str]
+    ip: Optional[str] = None
+    onepassword_item: Optional[str]
+    onepassword_vault: Optional[str]
+    enabled: bool = True
+    location: Optional[str] = None
+    model: Optional[str] = None
+    # Keys this script does not know about (e.g. notes), kept for round trips
+    extra: Dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Firewall':
+        """Build from an inventory entry, tolerating missing required keys"""
+        known = dict.fromkeys(_REQUIRED_FIELDS)
+        known.update((key, value) for key, value in data.items() if key in _FIREWALL_FIELDS)
+        extra = {key: value for key, value in data.items() if key not in _FIREWALL_FIELDS}
+        return cls(**known, extra=extra)
+    
+    def missing_fields(self) -> List[str]:
+        """Names of required fields that are not set"""
+        return [key for key in _REQUIRED_FIELDS if getattr(self, key) is None]
+    
+    def to_dict(self) -> Dict:
+        """Serialize for the inventory file, omitting unset optional fields"""
+        data = {
+            key: value for key, value in asdict(self).items()
+            if key != 'extra' and value is not None
+        }
+        data.update(self.extra)
+        return data
+
+
+_FIREWALL_FIELDS = frozenset(f.name for f in fields(Firewall)) - {'extra'}
+_REQUIRED_FIELDS = ('name', 'hostname', 'onepassword_item', 'onepassword_vault')
+
 
 def load_inventory() -> Dict:
-    """Load inventory from file"""
+    """Load inventory from file, with firewall entries as Firewall objects"""
     try:
-        with open(INVENTORY_FILE, 'r') as f:
-            return json.load(f)
+        data = Path(INVENTORY_FILE).read_bytes()
+        inventory = orjson.loads(data) if orjson else json.loads(data)
     except FileNotFoundError:
         return {
             'firewalls': [],
@@ -25,33 +89,61 @@ def load_inventory() -> Dict:
                 'notification_email': 'firewall-admin@example.com'
             }
         }
+    
+    inventory['firewalls'] = [Firewall.from_dict(fw) for fw in inventory['firewalls']]
+    for position, fw in enumerate(inventory['firewalls'], start=1):
+        missing = fw.missing_fields()
+        if missing:
+            print(f"Warning: Firewall entry {position} ({fw.name or 'unnamed'}) "
+                  f"is missing {', '.join(missing)}")
+    return inventory
 
 
 def save_inventory(inventory: Dict):
     """Save inventory to file"""
-    with open(INVENTORY_FILE, 'w') as f:
-        json.dump(inventory, f, indent=2)
+    data = dict(inventory)
+    data['firewalls'] = [fw.to_dict() for fw in inventory['firewalls']]
+    
+    if orjson:
+        with open(INVENTORY_FILE, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(INVENTORY_FILE, 'w') as f:
+            json.dump(data, f, indent=2)
     print(f"Inventory saved to {INVENTORY_FILE}")
 
 
+def build_name_index(inventory: Dict) -> Dict[str, int]:
+    """Map firewall names to their position in inventory['firewalls']"""
+    return {fw.name: i for i, fw in enumerate(inventory['firewalls'])}
+
+
 def list_firewalls(inventory: Dict):
     """List all firewalls"""
     if not inventory['firewalls']:
         print("No firewalls in inventory")
         return
     
-    print(f"\n{'Name':<20} {'Hostname':<30} {'Enabled':<10} {'Location':<20}")
-    print("-" * 80)
-    
-    for fw in inventory['firewalls']:
-        enabled = "Yes" if fw.get('enabled', True) else "No"
-        location = fw.get('location', 'N/A')
-        print(f"{fw['name']:<20} {fw['hostname']:<30} {enabled:<10} {location:<20}")
-    
-    print(f"\nTotal firewalls: {len(inventory['firewalls'])}")
+    # Build the whole table and write it at once instead of printing per row
+    rows = [
+        "",
+        LIST_ROW_FORMAT.format(name='Name', hostname='Hostname', enabled='Enabled', location='Location'),
+        "-" * 80
+    ]
+    rows.extend(
+        LIST_ROW_FORMAT.format(
+            name=fw.name or '',
+            hostname=fw.hostname or '',
+            enabled="Yes" if fw.enabled else "No",
+            location=fw.location or 'N/A'
+        )
+        for fw in inventory['firewalls']
+    )
+    rows.append(f"\nTotal firewalls: {len(inventory['firewalls'])}")
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
-def add_firewall(inventory: Dict):
+def add_firewall(inventory: Dict, index: Dict[str, int]):
     """Add a new firewall"""
     print("\n=== Add New Firewall ===")
     
@@ -61,7 +153,7 @@ def add_firewall(inventory: Dict):
         return
     
     # Check for duplicate name
-    if any(fw['name'] == name for fw in inventory['firewalls']):
+    if name in index:
         print(f"Error: Firewall '{name}' already exists")
         return
     
@@ -85,27 +177,54 @@ def add_firewall(inventory: Dict):
         print("Error: 1Password vault name is required")
         return
     
-    firewall = {
-        'name': name,
-        'hostname': hostname,
-        'onepassword_item': op_item,
-        'onepassword_vault': op_vault,
-        'enabled': True
+    if create_firewall(inventory, index, name, hostname, op_item, op_vault, ip, location, model):
+        save_inventory(inventory)
+        print(f"\nFirewall '{name}' added successfully")
+
+
+def create_firewall(inventory: Dict, index: Dict[str, int], name: str, hostname: str,
+                    op_item: str, op_vault: str, ip: str = '', location: str = '',
+                    model: str = '', extra: Optional[Dict] = None) -> bool:
+    """
+    Validate and append a firewall to the inventory without saving
+    
+    Keys in extra (e.g. notes) are stored on the entry as-is.
+    
+    Returns:
+        True if the firewall was added, False if validation failed
+    """
+    required = {
+        'Name': name,
+        'Hostname': hostname,
+        '1Password item name': op_item,
+        '1Password vault name': op_vault
     }
+    for label, value in required.items():
+        if not value:
+            print(f"Error: {label} is required")
+            return False
+    
+    if name in index:
+        print(f"Error: Firewall '{name}' already exists")
+        return False
     
-    if ip:
-        firewall['ip'] = ip
-    if location:
-        firewall['location'] = location
-    if model:
-        firewall['model'] = model
+    firewall = Firewall(
+        name=name,
+        hostname=hostname,
+        ip=ip or None,
+        onepassword_item=op_item,
+        onepassword_vault=op_vault,
+        location=location or None,
+        model=model or None,
+        extra=dict(extra or {})
+    )
     
+    index[name] = len(inventory['firewalls'])
     inventory['firewalls'].append(firewall)
-    save_inventory(inventory)
-    print(f"\nFirewall '{name}' added successfully")
+    return True
 
 
-def remove_firewall(inventory: Dict):
+def remove_firewall(inventory: Dict, index: Dict[str, int]):
     """Remove a firewall"""
     list_firewalls(inventory)
     
@@ -114,21 +233,35 @@ def remove_firewall(inventory: Dict):
     
     name = input("\nEnter firewall name to remove: ").strip()
     
-    for i, fw in enumerate(inventory['firewalls']):
-        if fw['name'] == name:
-            confirm = input(f"Are you sure you want to remove '{name}'? (yes/no): ").lower()
-            if confirm == 'yes':
-                inventory['firewalls'].pop(i)
-                save_inventory(inventory)
-                print(f"Firewall '{name}' removed successfully")
-            else:
-                print("Removal cancelled")
-            return
+    if name not in index:
+        print(f"Firewall '{name}' not found")
+        return
+    
+    confirm = input(f"Are you sure you want to remove '{name}'? (yes/no): ").lower()
+    if confirm == 'yes':
+        delete_firewall(inventory, index, name)
+        save_inventory(inventory)
+        print(f"Firewall '{name}' removed successfully")
+    else:
+        print("Removal cancelled")
+
+
+def delete_firewall(inventory: Dict, index: Dict[str, int], name: str) -> bool:
+    """Remove a firewall from the inventory without saving"""
+    i = index.pop(name, None)
+    if i is None:
+        print(f"Firewall '{name}' not found")
+        return False
     
-    print(f"Firewall '{name}' not found")
+    firewalls = inventory['firewalls']
+    firewalls.pop(i)
+    # Entries after the removed one shift down by one
+    for j in range(i, len(firewalls)):
+        index[firewalls[j].name] = j
+    return True
 
 
-def enable_disable_firewall(inventory: Dict, enable: bool):
+def enable_disable_firewall(inventory: Dict, index: Dict[str, int], enable: bool):
     """Enable or disable a firewall"""
     list_firewalls(inventory)
     
@@ -138,14 +271,20 @@ def enable_disable_firewall(inventory: Dict, enable: bool):
     action = "enable" if enable else "disable"
     name = input(f"\nEnter firewall name to {action}: ").strip()
     
-    for fw in inventory['firewalls']:
-        if fw['name'] == name:
-            fw['enabled'] = enable
-            save_inventory(inventory)
-            print(f"Firewall '{name}' {action}d successfully")
-            return
+    if set_firewall_enabled(inventory, index, name, enable):
+        save_inventory(inventory)
+        print(f"Firewall '{name}' {action}d successfully")
+
+
+def set_firewall_enabled(inventory: Dict, index: Dict[str, int], name: str, enable: bool) -> bool:
+    """Enable or disable a firewall in the inventory without saving"""
+    i = index.get(name)
+    if i is None:
+        print(f"Firewall '{name}' not found")
+        return False
     
-    print(f"Firewall '{name}' not found")
+    inventory['firewalls'][i].enabled = enable
+    return True
 
 
 def update_settings(inventory: Dict):
@@ -189,6 +328,11 @@ def update_settings(inventory: Dict):
 
 def main_menu():
     """Display main menu"""
+    # Every action edits this copy in place and saves it, so it only needs
+    # to be read once
+    inventory = load_inventory()
+    index = build_name_index(inventory)
+    
     while True:
         print("\n" + "="*50)
         print("Firewall Inventory Manager")
@@ -203,18 +347,16 @@ def main_menu():
         
         choice = input("\nSelect option: ").strip()
         
-        inventory = load_inventory()
-        
         if choice == '1':
             list_firewalls(inventory)
         elif choice == '2':
-            add_firewall(inventory)
+            add_firewall(inventory, index)
         elif choice == '3':
-            remove_firewall(inventory)
+            remove_firewall(inventory, index)
         elif choice == '4':
-            enable_disable_firewall(inventory, True)
+            enable_disable_firewall(inventory, index, True)
         elif choice == '5':
-            enable_disable_firewall(inventory, False)
+            enable_disable_firewall(inventory, index, False)
         elif choice == '6':
             update_settings(inventory)
         elif choice == '7':
@@ -224,5 +366,187 @@ def main_menu():
             print("Invalid option")
 
 
+# Subcommand handlers. Each works on the already-loaded inventory and its name
+# index (see build_name_index) and returns whether it changed the inventory.
+# Failures are reported and then raised as CommandError, so nothing is saved
+# unless the whole command succeeds.
+
+class CommandError(Exception):
+    """A subcommand failed after printing its error"""
+
+
+def cmd_list(inventory: Dict, index: Dict[str, int], args: argparse.Namespace) -> bool:
+    list_firewalls(inventory)
+    return False
+
+
+def cmd_add(inventory: Dict, index: Dict[str, int], args: argparse.Namespace) -> bool:
+    if not create_firewall(inventory, index, args.name, args.hostname, args.item, args.vault,
+                           args.ip, args.location, args.model):
+        raise CommandError
+    print(f"Firewall '{args.name}' added successfully")
+    return True
+
+
+def cmd_bulk_add(inventory: Dict, index: Dict[str, int], args: argparse.Namespace) -> bool:
+    try:
+        # utf-8-sig strips the byte-order mark Excel writes at the start of CSVs
+        with open(args.from_csv, newline='', encoding='utf-8-sig') as f:
+            rows = list(csv.DictReader(f))
+    except FileNotFoundError:
+        print(f"Error: CSV file not found: {args.from_csv}")
+        raise CommandError
+    
+    # Other columns are kept on the entry like unknown keys in the inventory
+    # file, except inventory fields this import does not set
+    unsupported = sorted((set(rows[0]) if rows else set()) & (_FIREWALL_FIELDS - set(CSV_COLUMNS)))
+    if unsupported:
+        print(f"Error: {args.from_csv} has unsupported columns: {', '.join(unsupported)}")
+        raise CommandError
+    
+    for row_no, row in enumerate(rows, start=1):
+        row = {key: (value or '').strip() for key, value in row.items() if key}
+        extra = {key: value for key, value in row.items() if key not in CSV_COLUMNS and value}
+        if not create_firewall(
+            inventory,
+            index,
+            row.get('name', ''),
+            row.get('hostname', ''),
+            row.get('onepassword_item', ''),
+            row.get('onepassword_vault', ''),
+            row.get('ip', ''),
+            row.get('location', ''),
+            row.get('model', ''),
+            extra
+        ):
+            print(f"Error: {args.from_csv} row {row_no} rejected, no firewalls added")
+            raise CommandError
+    
+    print(f"Added {len(rows)} firewalls from {args.from_csv}")
+    return bool(rows)
+
+
+def cmd_remove(inventory: Dict, index: Dict[str, int], args: argparse.Namespace) -> bool:
+    if args.name not in index:
+        print(f"Firewall '{args.name}' not found")
+        raise CommandError
+    
+    if not args.yes:
+        confirm = input(f"Are you sure you want to remove '{args.name}'? (yes/no): ").lower()
+        if confirm != 'yes':
+            print("Removal cancelled")
+            raise CommandError
+    
+    if not delete_firewall(inventory, index, args.name):
+        raise CommandError
+    print(f"Firewall '{args.name}' removed successfully")
+    return True
+
+
+def cmd_enable(inventory: Dict, index: Dict[str, int], args: argparse.Namespace) -> bool:
+    action = "enable" if args.enable else "disable"
+    
+    # Check every name first so nothing is reported as changed on failure
+    missing = [name for name in args.names if name not in index]
+    if missing:
+        for name in missing:
+            print(f"Firewall '{name}' not found")
+        raise CommandError
+    
+    for name in args.names:
+        set_firewall_enabled(inventory, index, name, args.enable)
+        print(f"Firewall '{name}' {action}d successfully")
+    return True
+
+
+def cmd_settings(inventory: Dict, index: Dict[str, int], args: argparse.Namespace) -> bool:
+    settings = inventory['settings']
+    updates = {}
+    
+    if args.check_interval_days is not None:
+        updates['check_interval_days'] = args.check_interval_days
+    if args.backup_before_update is not None:
+        updates['backup_before_update'] = args.backup_before_update == 'yes'
+    if args.auto_commit is not None:
+        updates['auto_commit'] = args.auto_commit == 'yes'
+    if args.notification_email:
+        updates['notification_email'] = args.notification_email
+    
+    changed = any(settings.get(key) != value for key, value in updates.items())
+    settings.update(updates)
+    
+    for key, value in settings.items():
+        print(f"{key}: {value}")
+    return changed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(
+        description='Manage the firewall inventory (interactive menu if no command is given)'
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    
+    list_parser = subparsers.add_parser('list', help='List all firewalls')
+    list_parser.set_defaults(func=cmd_list)
+    
+    add_parser = subparsers.add_parser('add', help='Add a firewall')
+    add_parser.add_argument('name', help='Firewall name')
+    add_parser.add_argument('hostname', help='Hostname or IP address')
+    add_parser.add_argument('--item', required=True, help='1Password item name')
+    add_parser.add_argument('--vault', required=True, help='1Password vault name')
+    add_parser.add_argument('--ip', default='', help='IP address')
+    add_parser.add_argument('--location', default='', help='Location')
+    add_parser.add_argument('--model', default='', help='Model')
+    add_parser.set_defaults(func=cmd_add)
+    
+    bulk_parser = subparsers.add_parser(
+        'bulk-add',
+        help='Add firewalls from a CSV file',
+        description='Add firewalls from a CSV file with columns name, hostname, '
+                    'onepassword_item, onepassword_vault and optionally ip, location, model. '
+                    'Any other columns (e.g. notes) are stored on the entries as-is; '
+                    'non-empty cells only. Nothing is added unless every row is valid.'
+    )
+    bulk_parser.add_argument('--from-csv', required=True, metavar='PATH', help='CSV file to import')
+    bulk_parser.set_defaults(func=cmd_bulk_add)
+    
+    rm_parser = subparsers.add_parser('rm', help='Remove a firewall')
+    rm_parser.add_argument('name', help='Firewall name')
+    rm_parser.add_argument('--yes', action='store_true', help='Do not ask for confirmation')
+    rm_parser.set_defaults(func=cmd_remove)
+    
+    for command, enable in (('enable', True), ('disable', False)):
+        toggle_parser = subparsers.add_parser(command, help=f'{command.capitalize()} firewalls')
+        toggle_parser.add_argument('names', nargs='+', metavar='name', help='Firewall name')
+        toggle_parser.set_defaults(func=cmd_enable, enable=enable)
+    
+    settings_parser = subparsers.add_parser('settings', help='Show or update global settings')
+    settings_parser.add_argument('--check-interval-days', type=int, help='Check interval in days')
+    settings_parser.add_argument('--backup-before-update', choices=['yes', 'no'], help='Backup before update')
+    settings_parser.add_argument('--auto-commit', choices=['yes', 'no'], help='Auto commit')
+    settings_parser.add_argument('--notification-email', help='Notification email')
+    settings_parser.set_defaults(func=cmd_settings)
+    
+    return parser
+
+
+def main():
+    """Main entry point"""
+    args = build_parser().parse_args()
+    
+    if args.command is None:
+        main_menu()
+        return
+    
+    inventory = load_inventory()
+    try:
+        changed = args.func(inventory, build_name_index(inventory), args)
+    except CommandError:
+        sys.exit(1)
+    if changed:
+        save_inventory(inventory)
+
+
 if __name__ == '__main__':
-    main_menu()
+    main()